@@ -15,6 +15,7 @@ from collections import Counter
 from producer_consumer import (
     BoundedBuffer,
     SourceContainer,
+    GeneratorSourceContainer,
     DestinationContainer,
     Producer,
     Consumer,
@@ -139,14 +140,64 @@ class TestBoundedBuffer(unittest.TestCase):
         buf = BoundedBuffer(1)
         buf.put(1)
         start = time.monotonic()
-        
+
         with self.assertRaises(BufferTimeoutError):
             buf.put(2, timeout=0.2)
-        
+
         elapsed = time.monotonic() - start
         self.assertGreaterEqual(elapsed, 0.18)
         self.assertLess(elapsed, 0.5)
 
+    def test_put_many_take_many_fifo(self):
+        """Batch put and take preserve item order."""
+        buf = BoundedBuffer(5)
+        buf.put_many([1, 2, 3, 4, 5])
+        self.assertEqual(buf.take_many(10), [1, 2, 3, 4, 5])
+        self.assertEqual(buf.size(), 0)
+
+    def test_put_many_timeout(self):
+        """put_many() raises when the batch cannot fit before the deadline."""
+        buf = BoundedBuffer(2)
+        start = time.monotonic()
+
+        with self.assertRaises(BufferTimeoutError):
+            buf.put_many([1, 2, 3], timeout=0.2)
+
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertLess(elapsed, 0.5)
+        # The first two items fit before the timeout and stay queued.
+        self.assertEqual(buf.take_many(10), [1, 2])
+
+    def test_take_many_timeout_on_empty(self):
+        """take_many() raises when no first item arrives in time."""
+        buf = BoundedBuffer(1)
+
+        with self.assertRaises(BufferTimeoutError):
+            buf.take_many(3, timeout=0.2)
+
+    def test_take_many_releases_all_slots(self):
+        """take_many() frees one slot per drained item."""
+        buf = BoundedBuffer(3)
+        buf.put_many([1, 2, 3])
+
+        self.assertEqual(buf.take_many(3), [1, 2, 3])
+
+        # All three slots must be free again; a fourth put must not fit.
+        for i in range(3):
+            self.assertTrue(buf.try_put(i))
+        self.assertFalse(buf.try_put(99))
+
+    def test_try_put_try_take(self):
+        """Non-blocking put/take report full and empty without waiting."""
+        buf = BoundedBuffer(1)
+
+        self.assertTrue(buf.try_put(7))
+        self.assertFalse(buf.try_put(8))
+
+        self.assertEqual(buf.try_take(), 7)
+        self.assertIsNone(buf.try_take())
+
 
 class TestSourceContainer(unittest.TestCase):
     """Test SourceContainer thread safety."""
@@ -183,6 +234,63 @@ class TestSourceContainer(unittest.TestCase):
         self.assertEqual(sorted(result), items)
 
 
+class TestGeneratorSourceContainer(unittest.TestCase):
+    """Test GeneratorSourceContainer lazy iteration."""
+
+    def test_sequential_access(self):
+        """Items drawn lazily, in order, with a running count."""
+        source = GeneratorSourceContainer(x * x for x in range(3))
+        self.assertEqual(source.get_next(), 0)
+        self.assertEqual(source.get_next(), 1)
+        self.assertEqual(source.get_next(), 4)
+        self.assertIsNone(source.get_next())
+        self.assertEqual(source.size(), 3)
+
+    def test_thread_safe_access(self):
+        """Multiple threads can safely drain the generator."""
+        items = list(range(1, 101))
+        source = GeneratorSourceContainer(iter(items))
+        result = []
+        lock = threading.Lock()
+
+        def getter():
+            while True:
+                item = source.get_next()
+                if item is None:
+                    break
+                with lock:
+                    result.append(item)
+
+        threads = [threading.Thread(target=getter) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(sorted(result), items)
+        self.assertEqual(source.size(), len(items))
+
+    def test_pipeline_with_generator_source(self):
+        """Producer streams directly from a generator source."""
+        data = list(range(20))
+        source = GeneratorSourceContainer(iter(data))
+        destination = DestinationContainer(capacity_hint=len(data))
+        buffer = BoundedBuffer(4)
+        poison = object()
+
+        producer = Producer(source, buffer, poison, name="P-Gen")
+        consumer = Consumer(buffer, destination, poison, name="C-Gen")
+
+        producer.start()
+        consumer.start()
+        producer.join(timeout=2.0)
+        consumer.join(timeout=2.0)
+
+        self.assertFalse(producer.is_alive())
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(destination.get_items(), data)
+
+
 class TestDestinationContainer(unittest.TestCase):
     """Test DestinationContainer thread safety."""
     
@@ -207,6 +315,38 @@ class TestDestinationContainer(unittest.TestCase):
         self.assertEqual(dest.size(), 100)
         self.assertEqual(sorted(dest.get_items()), list(range(100)))
 
+    def test_add_many(self):
+        """Batch adds append in order alongside single adds."""
+        dest = DestinationContainer()
+        dest.add(0)
+        dest.add_many([1, 2, 3])
+        dest.add_many([4])
+
+        self.assertEqual(dest.size(), 5)
+        self.assertEqual(dest.get_items(), [0, 1, 2, 3, 4])
+
+    def test_capacity_hint_allows_overflow(self):
+        """A capacity hint pre-sizes storage but does not cap it."""
+        dest = DestinationContainer(capacity_hint=3)
+
+        for i in range(5):
+            dest.add(i)
+
+        self.assertEqual(dest.size(), 5)
+        self.assertEqual(dest.get_items(), [0, 1, 2, 3, 4])
+
+    def test_drain(self):
+        """drain() hands back all items and empties the container."""
+        dest = DestinationContainer(capacity_hint=3)
+        dest.add_many([1, 2, 3])
+
+        self.assertEqual(dest.drain(), [1, 2, 3])
+        self.assertEqual(dest.size(), 0)
+        self.assertEqual(dest.get_items(), [])
+
+        dest.add(4)
+        self.assertEqual(dest.drain(), [4])
+
 
 class TestProducerConsumer(unittest.TestCase):
     """Test complete producer-consumer pipeline."""
@@ -1,28 +1,161 @@
 import csv
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 from sales_record import SalesRecord
 
+try:
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+
+# Matches m-d-Y and d-m-Y dates with a consistent '-' or '/' delimiter.
+_DATE_RE = re.compile(r'(\d{1,2})([-/])(\d{1,2})\2(\d{4})')
+
+_BOM = b'\xef\xbb\xbf'
+
+
+def _records_from_rows(rows: Iterable[List[str]],
+                       indices: Tuple[int, ...]) -> Iterator[SalesRecord]:
+    """
+    Yields SalesRecord objects built from parsed CSV rows using the given
+    column indices. Skips malformed rows.
+    """
+    (i_oid, i_cust, i_cat, i_sub, i_city, i_date,
+     i_region, i_sales, i_disc, i_profit, i_state) = indices
+    parse_date = CSVLoader.parse_date
+
+    for row in rows:
+        try:
+            yield SalesRecord(
+                order_id=row[i_oid].strip(),
+                customer_name=row[i_cust].strip(),
+                category=row[i_cat].strip(),
+                sub_category=row[i_sub].strip(),
+                city=row[i_city].strip(),
+                order_date=parse_date(row[i_date]),
+                region=row[i_region].strip(),
+                sales=float(row[i_sales]),
+                discount=float(row[i_disc]),
+                profit=float(row[i_profit]),
+                state=row[i_state].strip()
+            )
+
+        except (ValueError, IndexError):
+            continue
+
+
+def _parse_range(filepath: str, start: int, end: int, skip_partial: bool,
+                 indices: Tuple[int, ...]) -> List[SalesRecord]:
+    """
+    Parses the rows whose lines begin in the byte range [start, end).
+
+    Module-level so ProcessPoolExecutor can pickle it for worker
+    processes. Assumes records do not contain embedded newlines, which
+    holds for this dataset.
+    """
+    lines = []
+    with open(filepath, 'rb', buffering=1 << 20) as raw:
+        if skip_partial:
+            # Skip the first line only when `start` lands mid-line; if the
+            # preceding byte is a newline, the line beginning exactly at
+            # `start` belongs to this range, since the previous worker only
+            # reads lines that begin strictly before its end bound.
+            raw.seek(start - 1)
+            if raw.read(1) != b'\n':
+                raw.readline()
+        else:
+            raw.seek(start)
+
+        while raw.tell() < end:
+            line = raw.readline()
+            if not line:
+                break
+            lines.append(line)
+
+    text = b''.join(lines).decode('utf-8')
+    return list(_records_from_rows(csv.reader(io.StringIO(text, newline='')), indices))
+
 
 class CSVLoader:
     """
     Utility class for loading and parsing sales data from CSV files.
     """
 
+    # Column names expected in the CSV header, in no particular order.
+    COLUMNS = ('Order ID', 'Customer Name', 'Category', 'Sub Category',
+               'City', 'Order Date', 'Region', 'Sales', 'Discount',
+               'Profit', 'State')
+
+    # Files smaller than this are parsed serially; forking workers would
+    # cost more than the parse itself.
+    PARALLEL_THRESHOLD = 1 << 20
+
     @staticmethod
     def parse_date(date_str: str) -> datetime:
         """
         Parses a date string into a datetime object using supported formats.
+        Month-first is assumed when the date is ambiguous, matching the
+        format precedence previously used with strptime.
         Raises ValueError if the format is invalid.
         """
-        date_str = date_str.strip()
-        formats = ['%m-%d-%Y', '%d-%m-%Y', '%m/%d/%Y', '%d/%m/%Y']
-        for fmt in formats:
+        match = _DATE_RE.fullmatch(date_str.strip())
+        if not match:
+            raise ValueError(f"Unable to parse date: {date_str}")
+
+        first, second, year = int(match.group(1)), int(match.group(3)), int(match.group(4))
+        if first > 12:
+            day, month = first, second
+        else:
+            month, day = first, second
+
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            raise ValueError(f"Unable to parse date: {date_str}") from None
+
+    @staticmethod
+    def _column_indices(header: List[str]) -> Optional[Tuple[int, ...]]:
+        """
+        Resolves the positions of the expected columns in a header row,
+        or None if any column is missing.
+        """
+        try:
+            return tuple(header.index(name) for name in CSVLoader.COLUMNS)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def iter_sales_data(filepath: str) -> Iterator[SalesRecord]:
+        """
+        Yields sales records from a CSV file one at a time, so callers can
+        process rows while the file is still being read instead of
+        materializing the full list in memory. Skips malformed rows.
+        """
+        # Read through a 1 MiB buffer and strip any UTF-8 BOM once up
+        # front, rather than paying the utf-8-sig codec's check on every
+        # read.
+        with open(filepath, 'rb', buffering=1 << 20) as raw:
+            if raw.peek(3)[:3] == _BOM:
+                raw.read(3)
+
+            file = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+            reader = csv.reader(file)
+
             try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Unable to parse date: {date_str}")
+                header = next(reader)
+            except StopIteration:
+                return
+
+            indices = CSVLoader._column_indices(header)
+            if indices is None:
+                return
+
+            yield from _records_from_rows(reader, indices)
 
     @staticmethod
     def load_sales_data(filepath: str) -> List[SalesRecord]:
@@ -30,29 +163,160 @@ class CSVLoader:
         Loads sales records from a CSV file and returns a list of SalesRecord objects.
         Skips malformed rows.
         """
-        records: List[SalesRecord] = []
+        return list(CSVLoader.iter_sales_data(filepath))
 
-        with open(filepath, 'r', encoding='utf-8-sig', newline='') as file:
-            reader = csv.DictReader(file)
+    @staticmethod
+    def load_columns(filepath: str) -> dict:
+        """
+        Parses a CSV file straight into parallel columns, skipping
+        SalesRecord allocation entirely. Returns keyword arguments for
+        SalesAnalytics.from_columns. Skips malformed rows.
+        """
+        columns = {name: [] for name in
+                   ('sales', 'profit', 'discount', 'year', 'month',
+                    'category', 'sub_category', 'region', 'city',
+                    'customer_name')}
+        appends = {name: column.append for name, column in columns.items()}
+        parse_date = CSVLoader.parse_date
+
+        with open(filepath, 'rb', buffering=1 << 20) as raw:
+            if raw.peek(3)[:3] == _BOM:
+                raw.read(3)
+
+            file = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+            reader = csv.reader(file)
+
+            try:
+                header = next(reader)
+            except StopIteration:
+                return columns
+
+            indices = CSVLoader._column_indices(header)
+            if indices is None:
+                return columns
+
+            (_, i_cust, i_cat, i_sub, i_city, i_date,
+             i_region, i_sales, i_disc, i_profit, _) = indices
 
             for row in reader:
                 try:
-                    record = SalesRecord(
-                        order_id=row['Order ID'].strip(),
-                        customer_name=row['Customer Name'].strip(),
-                        category=row['Category'].strip(),
-                        sub_category=row['Sub Category'].strip(),
-                        city=row['City'].strip(),
-                        order_date=CSVLoader.parse_date(row['Order Date']),
-                        region=row['Region'].strip(),
-                        sales=float(row['Sales']),
-                        discount=float(row['Discount']),
-                        profit=float(row['Profit']),
-                        state=row['State'].strip()
-                    )
-                    records.append(record)
-
-                except (ValueError, KeyError):
+                    date = parse_date(row[i_date])
+                    sales = float(row[i_sales])
+                    discount = float(row[i_disc])
+                    profit = float(row[i_profit])
+                except (ValueError, IndexError):
                     continue
 
+                appends['sales'](sales)
+                appends['profit'](profit)
+                appends['discount'](discount)
+                appends['year'](date.year)
+                appends['month'](date.month)
+                appends['category'](row[i_cat].strip())
+                appends['sub_category'](row[i_sub].strip())
+                appends['region'](row[i_region].strip())
+                appends['city'](row[i_city].strip())
+                appends['customer_name'](row[i_cust].strip())
+
+        return columns
+
+    @staticmethod
+    def load_sales_data_parallel(filepath: str,
+                                 max_workers: Optional[int] = None) -> List[SalesRecord]:
+        """
+        Loads sales records by splitting the file into newline-aligned
+        byte ranges parsed in parallel worker processes, sidestepping the
+        GIL for the CPU-bound date and float parsing. Record order is
+        preserved. Falls back to the serial loader for small files.
+        """
+        size = os.path.getsize(filepath)
+        workers = max_workers or os.cpu_count() or 1
+        if size < CSVLoader.PARALLEL_THRESHOLD or workers <= 1:
+            return CSVLoader.load_sales_data(filepath)
+
+        with open(filepath, 'rb') as raw:
+            if raw.peek(3)[:3] == _BOM:
+                raw.read(3)
+            header_line = raw.readline()
+            data_start = raw.tell()
+
+        header = next(csv.reader([header_line.decode('utf-8')]))
+        indices = CSVLoader._column_indices(header)
+        if indices is None:
+            return []
+
+        bounds = [data_start + (size - data_start) * i // workers
+                  for i in range(workers + 1)]
+
+        records: List[SalesRecord] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_parse_range, filepath, bounds[i], bounds[i + 1],
+                            i > 0, indices)
+                for i in range(workers)
+            ]
+            for future in futures:
+                records.extend(future.result())
+
+        return records
+
+    @staticmethod
+    def load_sales_data_fast(filepath: str) -> List[SalesRecord]:
+        """
+        Loads sales records using pandas' C tokenizer when pandas is
+        installed, falling back to the pure-Python loader otherwise.
+        Skips malformed rows.
+        """
+        if _pd is None:
+            return CSVLoader.load_sales_data(filepath)
+
+        # on_bad_lines='skip' drops rows with extra delimiters, which the
+        # C tokenizer would otherwise abort the whole load over; the
+        # serial loader just skips them.
+        frame = _pd.read_csv(
+            filepath,
+            usecols=list(CSVLoader.COLUMNS),
+            encoding='utf-8-sig',
+            on_bad_lines='skip'
+        )
+
+        # Coerce the numeric columns and drop rows that fail, so a bad or
+        # missing value skips that row like the serial loader instead of
+        # aborting the whole load (as a hard dtype would) or surfacing
+        # NaN-valued records.
+        numeric = ['Sales', 'Discount', 'Profit']
+        for name in numeric:
+            frame[name] = _pd.to_numeric(frame[name], errors='coerce')
+        frame = frame.dropna(subset=numeric)
+
+        # A missing value in a string column comes back as NaN; the
+        # serial loader sees the empty cell as '', so normalize rather
+        # than materializing records holding the literal string 'nan'.
+        strings = [name for name in CSVLoader.COLUMNS if name not in numeric]
+        frame[strings] = frame[strings].fillna('')
+
+        parse_date = CSVLoader.parse_date
+        records: List[SalesRecord] = []
+        append = records.append
+        columns = [frame[name].tolist() for name in CSVLoader.COLUMNS]
+
+        for (oid, cust, cat, sub, city, date, region,
+             sales, disc, profit, state) in zip(*columns):
+            try:
+                append(SalesRecord(
+                    order_id=str(oid).strip(),
+                    customer_name=str(cust).strip(),
+                    category=str(cat).strip(),
+                    sub_category=str(sub).strip(),
+                    city=str(city).strip(),
+                    order_date=parse_date(str(date)),
+                    region=str(region).strip(),
+                    sales=sales,
+                    discount=disc,
+                    profit=profit,
+                    state=str(state).strip()
+                ))
+            except ValueError:
+                continue
+
         return records
@@ -1,210 +1,363 @@
-from typing import List, Dict, Callable, Any
-from functools import reduce
-from itertools import groupby
-from operator import attrgetter, itemgetter
-from statistics import mean, median, stdev
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Callable, Any, Sequence, Tuple
+from math import fsum, sqrt
 from sales_record import SalesRecord
 
 
+def _bincount(codes: Sequence[int], ngroups: int,
+              weights: Sequence[float] = None) -> list:
+    """
+    Sums weights (or counts occurrences) per integer code in one pass.
+
+    The stdlib analog of np.bincount: an O(N) scan over the code column
+    replacing the sort-then-groupby pattern, which costs O(N log N) plus
+    a per-group reduction.
+    """
+    if weights is None:
+        totals = [0] * ngroups
+        for code in codes:
+            totals[code] += 1
+    else:
+        totals = [0.0] * ngroups
+        for code, weight in zip(codes, weights):
+            totals[code] += weight
+    return totals
+
+
+def _unique_pair_counts(group_codes: Sequence[int], ngroups: int,
+                        member_codes: Sequence[int], nmembers: int) -> list:
+    """
+    Counts distinct member values per group, e.g. unique cities per region.
+
+    Packs each (group, member) code pair into one int so deduplication is
+    a single set of machine ints rather than a hash table of Python
+    tuples (or one set allocated per group).
+    """
+    pairs = {group * nmembers + member
+             for group, member in zip(group_codes, member_codes)}
+    counts = [0] * ngroups
+    for pair in pairs:
+        counts[pair // nmembers] += 1
+    return counts
+
+
+def _grouped_sums(codes: Sequence[int], ngroups: int,
+                  sales: Sequence[float],
+                  profit: Sequence[float] = None) -> tuple:
+    """
+    Fuses grouped sales sum, profit sum and count into a single pass.
+
+    Each separate _bincount call re-reads the code column and the zip
+    machinery; the axis analyses all need the same three reductions, so
+    one fused scan moves a third of the bytes and runs one loop.
+    """
+    total_sales = [0.0] * ngroups
+    counts = [0] * ngroups
+    if profit is None:
+        for code, s in zip(codes, sales):
+            total_sales[code] += s
+            counts[code] += 1
+        return total_sales, None, counts
+
+    total_profit = [0.0] * ngroups
+    for code, s, p in zip(codes, sales, profit):
+        total_sales[code] += s
+        total_profit[code] += p
+        counts[code] += 1
+    return total_sales, total_profit, counts
+
+
+def _median(sorted_values: Sequence[float]) -> float:
+    """Returns the median of an already-sorted sequence."""
+    mid = len(sorted_values) // 2
+    if len(sorted_values) % 2:
+        return sorted_values[mid]
+    return (sorted_values[mid - 1] + sorted_values[mid]) / 2.0
+
+
+def _column_stats(values: Sequence[float]) -> Dict[str, float]:
+    """
+    Computes total, mean, median, sample deviation, min and max for one
+    column with the minimum number of scans: a single sorted copy serves
+    median, min and max, and the remaining metrics take one fsum pass
+    each instead of a separate traversal per statistic.
+    """
+    n = len(values)
+    ordered = sorted(values)
+    total = fsum(values)
+    mean = total / n
+
+    return {
+        'total': total,
+        'mean': mean,
+        'median': _median(ordered),
+        'std_dev': sqrt(fsum((x - mean) ** 2 for x in values) / (n - 1))
+                   if n > 1 else 0,
+        'min': ordered[0],
+        'max': ordered[-1]
+    }
+
+
+def _encode(values: Sequence[Any]) -> Tuple[List[Any], "array"]:
+    """
+    Encodes a column of repeated values as (sorted unique labels, int codes).
+
+    Integer codes let grouped aggregations index small accumulator lists
+    instead of hashing full strings per record, and sorted labels keep
+    group output in the same order a sort-then-groupby pass would produce.
+    """
+    labels = sorted(set(values))
+    index = {label: code for code, label in enumerate(labels)}
+    return labels, array('i', map(index.__getitem__, values))
+
+
 class SalesAnalytics:
     """
     Provides analytics operations using functional programming patterns.
+
+    Records are transposed once at construction into structure-of-arrays
+    columns: contiguous float buffers for the numeric fields and integer
+    codes for the categorical ones. The analytics methods aggregate over
+    these compact columns instead of re-reading attributes off every
+    SalesRecord object per pass.
     """
 
     def __init__(self, records: List[SalesRecord]):
         """Initializes the analytics engine with sales records."""
         self.records = records
+        self._init_columns(
+            sales=array('d', (r.sales for r in records)),
+            profit=array('d', (r.profit for r in records)),
+            discount=array('d', (r.discount for r in records)),
+            year=array('i', (r.year for r in records)),
+            month=array('i', (r.month for r in records)),
+            category=[r.category for r in records],
+            sub_category=[r.sub_category for r in records],
+            region=[r.region for r in records],
+            city=[r.city for r in records],
+            customer_name=[r.customer_name for r in records],
+        )
+
+    @classmethod
+    def from_columns(cls, **columns) -> 'SalesAnalytics':
+        """
+        Builds the engine straight from parsed columns, e.g. the dict
+        returned by CSVLoader.load_columns, without materializing
+        SalesRecord objects at all. The record-based helpers (filter,
+        map) are unavailable on instances built this way.
+        """
+        self = cls.__new__(cls)
+        self.records = None
+        self._init_columns(**columns)
+        return self
+
+    def _init_columns(self, *, sales, profit, discount, year, month,
+                      category, sub_category, region, city,
+                      customer_name) -> None:
+        """Stores the numeric columns and encodes the categorical ones."""
+        self._sales = array('d', sales)
+        self._profit = array('d', profit)
+        self._discount = array('d', discount)
+        # profit_margin is a recomputed @property on SalesRecord; derive
+        # it once here so no analysis pays the per-record property call.
+        self._margin = array('d', ((p / s * 100) if s > 0 else 0.0
+                                   for s, p in zip(self._sales, self._profit)))
+        self._years = array('i', year)
+        self._months = array('i', month)
+
+        self._category_labels, self._category_codes = _encode(category)
+        self._subcat_labels, self._subcat_codes = _encode(sub_category)
+        self._region_labels, self._region_codes = _encode(region)
+        self._city_labels, self._city_codes = _encode(city)
+        self._customer_labels, self._customer_codes = _encode(customer_name)
 
     def summary_statistics(self) -> Dict[str, Dict[str, float]]:
         """Computes overall summary statistics for sales, profit, discount, and margin."""
-        sales_list = list(map(lambda r: r.sales, self.records))
-        profit_list = list(map(lambda r: r.profit, self.records))
-        discount_list = list(map(lambda r: r.discount, self.records))
-        margin_list = list(map(lambda r: r.profit_margin, self.records))
+        discount = _column_stats(self._discount)
+        margin = _column_stats(self._margin)
 
         return {
-            'sales': {
-                'total': reduce(lambda acc, x: acc + x, sales_list, 0.0),
-                'mean': mean(sales_list),
-                'median': median(sales_list),
-                'std_dev': stdev(sales_list) if len(sales_list) > 1 else 0,
-                'min': min(sales_list),
-                'max': max(sales_list)
-            },
-            'profit': {
-                'total': reduce(lambda acc, x: acc + x, profit_list, 0.0),
-                'mean': mean(profit_list),
-                'median': median(profit_list),
-                'std_dev': stdev(profit_list) if len(profit_list) > 1 else 0,
-                'min': min(profit_list),
-                'max': max(profit_list)
-            },
-            'discount': {
-                'mean': mean(discount_list),
-                'median': median(discount_list),
-                'min': min(discount_list),
-                'max': max(discount_list)
-            },
-            'profit_margin': {
-                'mean': mean(margin_list),
-                'median': median(margin_list)
-            }
+            'sales': _column_stats(self._sales),
+            'profit': _column_stats(self._profit),
+            'discount': {key: discount[key]
+                         for key in ('mean', 'median', 'min', 'max')},
+            'profit_margin': {key: margin[key]
+                              for key in ('mean', 'median')}
         }
 
     def category_performance_matrix(self) -> Dict[str, Dict[str, Any]]:
         """Aggregates sales and profit metrics by product category."""
-        sorted_records = sorted(self.records, key=attrgetter('category'))
-        result = {}
-
-        for category, group in groupby(sorted_records, key=attrgetter('category')):
-            group_list = list(group)
-            total_sales = sum(r.sales for r in group_list)
-            total_profit = sum(r.profit for r in group_list)
-
-            result[category] = {
-                'total_sales': total_sales,
-                'total_profit': total_profit,
-                'profit_margin': (total_profit / total_sales * 100) if total_sales else 0,
-                'transaction_count': len(group_list)
+        ncats = len(self._category_labels)
+        total_sales, total_profit, counts = _grouped_sums(
+            self._category_codes, ncats, self._sales, self._profit)
+
+        result = {
+            category: {
+                'total_sales': total_sales[code],
+                'total_profit': total_profit[code],
+                'profit_margin': (total_profit[code] / total_sales[code] * 100)
+                                 if total_sales[code] else 0,
+                'transaction_count': counts[code]
             }
+            for code, category in enumerate(self._category_labels)
+        }
 
         return dict(sorted(result.items(), key=lambda x: x[1]['total_sales'], reverse=True))
 
     def regional_efficiency_analysis(self) -> Dict[str, Dict[str, float]]:
         """Analyzes regional performance based on sales efficiency and customer reach."""
-        sorted_records = sorted(self.records, key=attrgetter('region'))
-        result = {}
-
-        for region, group in groupby(sorted_records, key=attrgetter('region')):
-            group_list = list(group)
-            total_sales = sum(r.sales for r in group_list)
-            total_profit = sum(r.profit for r in group_list)
-
-            result[region] = {
-                'total_sales': total_sales,
-                'total_profit': total_profit,
-                'profit_margin': (total_profit / total_sales * 100) if total_sales else 0,
-                'cities_served': len(set(r.city for r in group_list)),
-                'unique_customers': len(set(r.customer_name for r in group_list))
+        nregions = len(self._region_labels)
+        total_sales, total_profit, _ = _grouped_sums(
+            self._region_codes, nregions, self._sales, self._profit)
+        cities_served = _unique_pair_counts(
+            self._region_codes, nregions,
+            self._city_codes, len(self._city_labels))
+        unique_customers = _unique_pair_counts(
+            self._region_codes, nregions,
+            self._customer_codes, len(self._customer_labels))
+
+        result = {
+            region: {
+                'total_sales': total_sales[code],
+                'total_profit': total_profit[code],
+                'profit_margin': (total_profit[code] / total_sales[code] * 100)
+                                 if total_sales[code] else 0,
+                'cities_served': cities_served[code],
+                'unique_customers': unique_customers[code]
             }
+            for code, region in enumerate(self._region_labels)
+        }
 
         return dict(sorted(result.items(), key=lambda x: x[1]['profit_margin'], reverse=True))
 
+    DISCOUNT_BRACKETS = ('0-15%', '15-20%', '20-25%', '25-30%', '30%+')
+    _DISCOUNT_EDGES = (0.15, 0.20, 0.25, 0.30)
+
     def discount_optimization_analysis(self) -> Dict[str, Any]:
         """Evaluates profitability across predefined discount brackets."""
-        brackets = [
-            ('0-15%', lambda r: r.discount < 0.15),
-            ('15-20%', lambda r: 0.15 <= r.discount < 0.20),
-            ('20-25%', lambda r: 0.20 <= r.discount < 0.25),
-            ('25-30%', lambda r: 0.25 <= r.discount < 0.30),
-            ('30%+', lambda r: r.discount >= 0.30)
-        ]
+        nbuckets = len(self.DISCOUNT_BRACKETS)
+        total_sales = [0.0] * nbuckets
+        total_profit = [0.0] * nbuckets
+        counts = [0] * nbuckets
+
+        # One pass instead of one filter scan per bracket: bisect maps
+        # each discount to its bracket index against the sorted edges.
+        edges = self._DISCOUNT_EDGES
+        bucket_of = bisect_right
+        for discount, sales, profit in zip(self._discount, self._sales,
+                                           self._profit):
+            bucket = bucket_of(edges, discount)
+            total_sales[bucket] += sales
+            total_profit[bucket] += profit
+            counts[bucket] += 1
 
-        result = {}
-        for name, predicate in brackets:
-            records = list(filter(predicate, self.records))
-            if not records:
-                continue
-
-            total_sales = sum(r.sales for r in records)
-            total_profit = sum(r.profit for r in records)
-
-            result[name] = {
-                'transaction_count': len(records),
-                'total_sales': total_sales,
-                'total_profit': total_profit,
-                'profit_margin': (total_profit / total_sales * 100) if total_sales else 0
+        return {
+            name: {
+                'transaction_count': counts[bucket],
+                'total_sales': total_sales[bucket],
+                'total_profit': total_profit[bucket],
+                'profit_margin': (total_profit[bucket] / total_sales[bucket] * 100)
+                                 if total_sales[bucket] else 0
             }
-
-        return result
+            for bucket, name in enumerate(self.DISCOUNT_BRACKETS)
+            if counts[bucket]
+        }
 
     def customer_segmentation_analysis(self) -> Dict[str, Any]:
         """Segments customers into high, medium, and low value groups."""
-        sorted_records = sorted(self.records, key=attrgetter('customer_name'))
-        customer_metrics = {}
-
-        for customer, group in groupby(sorted_records, key=attrgetter('customer_name')):
-            group_list = list(group)
-            total_sales = sum(r.sales for r in group_list)
-            total_profit = sum(r.profit for r in group_list)
-
-            customer_metrics[customer] = {
-                'total_sales': total_sales,
-                'total_profit': total_profit,
-                'transaction_count': len(group_list)
-            }
-
-        sorted_customers = sorted(customer_metrics.items(), key=lambda x: x[1]['total_sales'], reverse=True)
-        total_customers = len(sorted_customers)
+        ncustomers = len(self._customer_labels)
+        total_sales, total_profit, counts = _grouped_sums(
+            self._customer_codes, ncustomers, self._sales, self._profit)
 
-        high = dict(sorted_customers[:int(total_customers * 0.2)])
-        mid = dict(sorted_customers[int(total_customers * 0.2):int(total_customers * 0.5)])
-        low = dict(sorted_customers[int(total_customers * 0.5):])
+        # Sort customer codes, not per-customer dicts: the comparison key
+        # is a float list lookup and no C-sized dict-of-dicts is built.
+        order = sorted(range(ncustomers), key=total_sales.__getitem__,
+                       reverse=True)
 
-        def summarize(segment):
+        def summarize(codes):
             """Summarizes aggregated metrics for a customer segment."""
-            total_sales = sum(m['total_sales'] for m in segment.values())
-            total_profit = sum(m['total_profit'] for m in segment.values())
+            segment_sales = fsum(total_sales[code] for code in codes)
+            segment_profit = fsum(total_profit[code] for code in codes)
 
             return {
-                'customer_count': len(segment),
-                'total_sales': total_sales,
-                'total_profit': total_profit,
-                'avg_sales_per_customer': total_sales / len(segment) if segment else 0
+                'customer_count': len(codes),
+                'total_sales': segment_sales,
+                'total_profit': segment_profit,
+                'avg_sales_per_customer': segment_sales / len(codes) if codes else 0
             }
 
         return {
-            'high_value': summarize(high),
-            'medium_value': summarize(mid),
-            'low_value': summarize(low),
-            'top_10_customers': dict(sorted_customers[:10])
+            'high_value': summarize(order[:int(ncustomers * 0.2)]),
+            'medium_value': summarize(order[int(ncustomers * 0.2):int(ncustomers * 0.5)]),
+            'low_value': summarize(order[int(ncustomers * 0.5):]),
+            'top_10_customers': {
+                self._customer_labels[code]: {
+                    'total_sales': total_sales[code],
+                    'total_profit': total_profit[code],
+                    'transaction_count': counts[code]
+                }
+                for code in order[:10]
+            }
         }
 
     def product_subcategory_deep_dive(self) -> Dict[str, List[Dict[str, Any]]]:
         """Provides detailed performance metrics for each product subcategory."""
-        sorted_records = sorted(self.records, key=lambda r: (r.category, r.sub_category))
-        result = {}
+        nsubs = len(self._subcat_labels)
+        # Pack (category, subcategory) into one composite code so a single
+        # fused scan aggregates every pair; the pair space is tiny compared
+        # to N, so the accumulator lists stay small.
+        packed = array('i', (cat * nsubs + sub for cat, sub in
+                             zip(self._category_codes, self._subcat_codes)))
+        total_sales, total_profit, counts = _grouped_sums(
+            packed, len(self._category_labels) * nsubs,
+            self._sales, self._profit)
 
-        for category, cat_group in groupby(sorted_records, key=attrgetter('category')):
-            cat_list = list(cat_group)
-            cat_list.sort(key=attrgetter('sub_category'))
-
-            subcats = []
-            for subcat, sub_group in groupby(cat_list, key=attrgetter('sub_category')):
-                sub_list = list(sub_group)
-
-                total_sales = sum(r.sales for r in sub_list)
-                total_profit = sum(r.profit for r in sub_list)
-
-                subcats.append({
+        result = {}
+        for cat_code, category in enumerate(self._category_labels):
+            base = cat_code * nsubs
+            subcats = [
+                {
                     'name': subcat,
-                    'sales': total_sales,
-                    'profit': total_profit,
-                    'margin': (total_profit / total_sales * 100) if total_sales else 0
-                })
-
+                    'sales': total_sales[base + sub_code],
+                    'profit': total_profit[base + sub_code],
+                    'margin': (total_profit[base + sub_code] /
+                               total_sales[base + sub_code] * 100)
+                              if total_sales[base + sub_code] else 0
+                }
+                for sub_code, subcat in enumerate(self._subcat_labels)
+                if counts[base + sub_code]
+            ]
             result[category] = sorted(subcats, key=lambda x: x['sales'], reverse=True)
 
         return result
 
     def temporal_trend_analysis(self) -> Dict[str, Any]:
         """Calculates yearly performance and growth trends."""
-        sorted_by_year = sorted(self.records, key=attrgetter('year'))
-        yearly_data = {}
-
-        for year, group in groupby(sorted_by_year, key=attrgetter('year')):
-            group_list = list(group)
-            total_sales = sum(r.sales for r in group_list)
-            total_profit = sum(r.profit for r in group_list)
-
-            yearly_data[year] = {
-                'sales': total_sales,
-                'profit': total_profit,
-                'transactions': len(group_list),
-                'avg_order_value': total_sales / len(group_list)
+        if not self._years:
+            return {'yearly_performance': {}, 'growth_rates': {}}
+
+        # Years span a tiny dense integer range, so subtracting the
+        # minimum indexes the accumulators directly — no label encoding
+        # or hashing pass is needed for this axis.
+        ymin = min(self._years)
+        nyears = max(self._years) - ymin + 1
+        total_sales, total_profit, counts = _grouped_sums(
+            (year - ymin for year in self._years), nyears,
+            self._sales, self._profit)
+
+        yearly_data = {
+            ymin + offset: {
+                'sales': total_sales[offset],
+                'profit': total_profit[offset],
+                'transactions': counts[offset],
+                'avg_order_value': total_sales[offset] / counts[offset]
             }
+            for offset in range(nyears)
+            if counts[offset]
+        }
 
-        years = sorted(yearly_data.keys())
+        years = list(yearly_data)
         growth_rates = {}
 
         for i in range(1, len(years)):
@@ -223,28 +376,32 @@ class SalesAnalytics:
 
     def profitability_drivers_analysis(self) -> Dict[str, Any]:
         """Identifies key drivers for high and low profit margin segments."""
-        high = list(filter(lambda r: r.profit_margin > 25, self.records))
-        low = list(filter(lambda r: r.profit_margin <= 25, self.records))
+        margin = self._margin
+        high = [i for i, m in enumerate(margin) if m > 25]
+        low = [i for i, m in enumerate(margin) if m <= 25]
 
-        def analyze(records):
-            """Summarizes profit characteristics for a given record set."""
-            if not records:
+        def analyze(indices):
+            """Summarizes profit characteristics for the indexed records."""
+            if not indices:
                 return None
 
-            total_sales = sum(r.sales for r in records)
-            total_profit = sum(r.profit for r in records)
+            sales = self._sales
+            profit = self._profit
+            discount = self._discount
+            codes = self._category_codes
 
-            categories = {}
-            for r in records:
-                categories[r.category] = categories.get(r.category, 0) + 1
+            counts = [0] * len(self._category_labels)
+            for i in indices:
+                counts[codes[i]] += 1
+            dominant = self._category_labels[counts.index(max(counts))]
 
             return {
-                'transaction_count': len(records),
-                'total_sales': total_sales,
-                'total_profit': total_profit,
-                'avg_profit_margin': mean(r.profit_margin for r in records),
-                'avg_discount': mean(r.discount for r in records),
-                'dominant_category': max(categories.items(), key=itemgetter(1))[0]
+                'transaction_count': len(indices),
+                'total_sales': fsum(sales[i] for i in indices),
+                'total_profit': fsum(profit[i] for i in indices),
+                'avg_profit_margin': fsum(margin[i] for i in indices) / len(indices),
+                'avg_discount': fsum(discount[i] for i in indices) / len(indices),
+                'dominant_category': dominant
             }
 
         return {
@@ -254,82 +411,100 @@ class SalesAnalytics:
 
     def city_market_analysis(self) -> List[Dict[str, Any]]:
         """Ranks cities based on total sales and profitability."""
-        sorted_records = sorted(self.records, key=attrgetter('city'))
-        city_data = []
-
-        for city, group in groupby(sorted_records, key=attrgetter('city')):
-            group_list = list(group)
-            total_sales = sum(r.sales for r in group_list)
-            total_profit = sum(r.profit for r in group_list)
-
-            city_data.append({
+        ncities = len(self._city_labels)
+        unique_customers = _unique_pair_counts(
+            self._city_codes, ncities,
+            self._customer_codes, len(self._customer_labels))
+        total_sales, total_profit, _ = _grouped_sums(
+            self._city_codes, ncities, self._sales, self._profit)
+
+        # Region of each city: first occurrence in record order, matching
+        # what the old stable sort-and-group pass reported.
+        region_of_city = [None] * ncities
+        for code, region_code in zip(self._city_codes, self._region_codes):
+            if region_of_city[code] is None:
+                region_of_city[code] = self._region_labels[region_code]
+
+        city_data = [
+            {
                 'city': city,
-                'region': group_list[0].region,
-                'sales': total_sales,
-                'profit': total_profit,
-                'margin': (total_profit / total_sales * 100) if total_sales else 0,
-                'unique_customers': len(set(r.customer_name for r in group_list))
-            })
+                'region': region_of_city[code],
+                'sales': total_sales[code],
+                'profit': total_profit[code],
+                'margin': (total_profit[code] / total_sales[code] * 100)
+                          if total_sales[code] else 0,
+                'unique_customers': unique_customers[code]
+            }
+            for code, city in enumerate(self._city_labels)
+        ]
 
         return sorted(city_data, key=lambda x: x['sales'], reverse=True)
 
     def discount_vs_volume_correlation(self) -> Dict[str, Any]:
         """Measures transaction volume differences between high and low discount levels."""
-        sorted_records = sorted(self.records, key=attrgetter('category'))
-        result = {}
+        ncats = len(self._category_labels)
+        high = [0] * ncats
+        low = [0] * ncats
 
-        for category, group in groupby(sorted_records, key=attrgetter('category')):
-            group_list = list(group)
-            high = [r for r in group_list if r.discount >= 0.25]
-            low = [r for r in group_list if r.discount < 0.15]
+        for code, discount in zip(self._category_codes, self._discount):
+            if discount >= 0.25:
+                high[code] += 1
+            elif discount < 0.15:
+                low[code] += 1
 
-            result[category] = {
-                'high_discount_transactions': len(high),
-                'low_discount_transactions': len(low),
-                'volume_lift_pct': ((len(high) - len(low)) / len(low) * 100) if low else 0
+        return {
+            category: {
+                'high_discount_transactions': high[code],
+                'low_discount_transactions': low[code],
+                'volume_lift_pct': ((high[code] - low[code]) / low[code] * 100)
+                                   if low[code] else 0
             }
-
-        return result
+            for code, category in enumerate(self._category_labels)
+        }
 
     def top_subcategories(self, limit: int = 10):
         """Returns the top-performing product subcategories by sales volume."""
-        sorted_records = sorted(self.records, key=attrgetter('sub_category'))
-        subcat_data = []
-
-        for subcat, group in groupby(sorted_records, key=attrgetter('sub_category')):
-            group_list = list(group)
+        nsubs = len(self._subcat_labels)
+        total_sales, total_profit, counts = _grouped_sums(
+            self._subcat_codes, nsubs, self._sales, self._profit)
 
-            total_sales = sum(r.sales for r in group_list)
-            total_profit = sum(r.profit for r in group_list)
+        category_of_sub = [None] * nsubs
+        for code, cat_code in zip(self._subcat_codes, self._category_codes):
+            if category_of_sub[code] is None:
+                category_of_sub[code] = self._category_labels[cat_code]
 
-            subcat_data.append({
+        subcat_data = [
+            {
                 "sub_category": subcat,
-                "category": group_list[0].category,
-                "sales": total_sales,
-                "profit": total_profit,
-                "margin": (total_profit / total_sales * 100) if total_sales else 0,
-                "transactions": len(group_list)
-            })
+                "category": category_of_sub[code],
+                "sales": total_sales[code],
+                "profit": total_profit[code],
+                "margin": (total_profit[code] / total_sales[code] * 100)
+                          if total_sales[code] else 0,
+                "transactions": counts[code]
+            }
+            for code, subcat in enumerate(self._subcat_labels)
+        ]
 
         subcat_data.sort(key=lambda x: x["sales"], reverse=True)
         return subcat_data[:limit]
 
     def monthly_seasonality_analysis(self) -> Dict[int, Dict[str, float]]:
         """Computes monthly sales seasonality indices."""
-        sorted_by_month = sorted(self.records, key=attrgetter('month'))
-        monthly_data = {}
-
-        for month, group in groupby(sorted_by_month, key=attrgetter('month')):
-            group_list = list(group)
-            total_sales = sum(r.sales for r in group_list)
-
-            monthly_data[month] = {
-                'sales': total_sales,
-                'transactions': len(group_list),
-                'avg_transaction': total_sales / len(group_list)
+        month_labels, month_codes = _encode(self._months)
+        nmonths = len(month_labels)
+        total_sales, _, counts = _grouped_sums(month_codes, nmonths, self._sales)
+
+        monthly_data = {
+            month: {
+                'sales': total_sales[code],
+                'transactions': counts[code],
+                'avg_transaction': total_sales[code] / counts[code]
             }
+            for code, month in enumerate(month_labels)
+        }
 
-        avg_monthly_sales = mean(m['sales'] for m in monthly_data.values())
+        avg_monthly_sales = fsum(total_sales) / nmonths
 
         for month in monthly_data:
             monthly_data[month]['index'] = (monthly_data[month]['sales'] / avg_monthly_sales) * 100
@@ -346,4 +521,4 @@ class SalesAnalytics:
 
     def count(self) -> int:
         """Returns the total number of records."""
-        return len(self.records)
+        return len(self._sales)
@@ -2,10 +2,13 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SalesRecord:
     """
     Data model representing a single sales transaction with computed properties.
+
+    slots=True drops the per-instance __dict__, which is the largest
+    single memory cost when the full CSV is loaded into records.
     """
     order_id: str
     customer_name: str
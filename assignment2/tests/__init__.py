@@ -0,0 +1,12 @@
+"""Test package; makes src/ importable once for every test module.
+
+Doing the sys.path setup here instead of in each test module means the
+insert runs a single time per session, when the package is first
+imported, and the import system's finder caches stay stable afterwards.
+"""
+import os
+import sys
+
+_SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)